@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 """Generate figures for the statute-graph paper."""
 
+import re
 from pathlib import Path
-import matplotlib.pyplot as plt
+import matplotlib.style
 import matplotlib.patches as mpatches
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 import numpy as np
 
 # Try to load real data, fall back to example data
@@ -22,7 +25,7 @@ OUTPUT_DIR = Path(__file__).parent.parent / "paper" / "_static" / "figures"
 OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 
 # Style settings
-plt.style.use('seaborn-v0_8-whitegrid')
+matplotlib.style.use('seaborn-v0_8-whitegrid')
 COLORS = {
     'primary': '#2563eb',  # Blue
     'secondary': '#059669',  # Green
@@ -30,6 +33,27 @@ COLORS = {
     'gray': '#6b7280',
 }
 
+# A single Agg-backed figure is reused for every plot, bypassing pyplot's
+# per-figure manager and backend setup.
+FIG = Figure()
+FigureCanvasAgg(FIG)
+
+
+def new_figure(width, height):
+    """Clear the shared figure and resize it for the next plot."""
+    FIG.clear()
+    FIG.set_size_inches(width, height)
+    return FIG
+
+
+def save_figure(fig, name):
+    """Lay out and write the figure to OUTPUT_DIR as a PNG."""
+    fig.tight_layout()
+    # Fast zlib level: PNG compression dominates save time at the default
+    fig.savefig(OUTPUT_DIR / name, dpi=150, bbox_inches='tight',
+                pil_kwargs={'compress_level': 1})
+    print(f"Saved {OUTPUT_DIR / name}")
+
 
 def fig1_hub_sections():
     """Figure 1: Most-referenced sections (hub analysis)."""
@@ -42,7 +66,8 @@ def fig1_hub_sections():
         sections = ['1', '401', '2', '48', '152', '414', '501', '7701', '42', '351', '162', '453']
         counts = [563, 238, 170, 168, 156, 142, 138, 125, 118, 112, 108, 102]
 
-    fig, ax = plt.subplots(figsize=(8, 5))
+    fig = new_figure(8, 5)
+    ax = fig.add_subplot()
     y_pos = np.arange(len(sections))
 
     bars = ax.barh(y_pos, counts, color=COLORS['primary'], edgecolor='white', linewidth=0.5)
@@ -65,10 +90,7 @@ def fig1_hub_sections():
     ax.spines['top'].set_visible(False)
     ax.spines['right'].set_visible(False)
 
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'hub_sections.png', dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Saved {OUTPUT_DIR / 'hub_sections.png'}")
+    save_figure(fig, 'hub_sections.png')
 
 
 def fig2_scc_distribution():
@@ -86,7 +108,8 @@ def fig2_scc_distribution():
     sizes = sorted(size_counts.keys())
     counts = [size_counts[s] for s in sizes]
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
+    fig = new_figure(10, 4)
+    ax1, ax2 = fig.subplots(1, 2)
 
     # Left: All SCCs (log scale)
     ax1.bar(sizes[:10], counts[:10], color=COLORS['primary'], edgecolor='white')
@@ -111,15 +134,13 @@ def fig2_scc_distribution():
     )
     ax2.set_title('Sections by Cycle Status', fontsize=11, fontweight='bold')
 
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'scc_distribution.png', dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Saved {OUTPUT_DIR / 'scc_distribution.png'}")
+    save_figure(fig, 'scc_distribution.png')
 
 
 def fig3_dependency_flow():
     """Figure 3: Conceptual diagram of encoding order."""
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = new_figure(10, 6)
+    ax = fig.add_subplot()
     ax.set_xlim(0, 10)
     ax.set_ylim(0, 7)
     ax.axis('off')
@@ -159,25 +180,25 @@ def fig3_dependency_flow():
 
     ax.set_title('Optimal Encoding Order: Dependency Levels', fontsize=12, fontweight='bold', y=1.02)
 
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'dependency_flow.png', dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Saved {OUTPUT_DIR / 'dependency_flow.png'}")
+    save_figure(fig, 'dependency_flow.png')
 
 
 def fig4_degree_distribution():
     """Figure 4: In-degree and out-degree distributions."""
     if USE_REAL_DATA:
-        sequence = g.get_encoding_sequence()
-        in_degrees = [item['dependencies'] for item in sequence]
-        out_degrees = [item['dependents'] for item in sequence]
+        # Dependencies are outgoing edges in networkx terms, dependents incoming
+        in_degrees = np.fromiter((d for _, d in g._graph.out_degree()),
+                                 dtype=np.int32, count=g.num_nodes)
+        out_degrees = np.fromiter((d for _, d in g._graph.in_degree()),
+                                  dtype=np.int32, count=g.num_nodes)
     else:
         # Example power-law-ish distributions
         np.random.seed(42)
         in_degrees = np.random.exponential(5, 2448).astype(int)
         out_degrees = np.random.exponential(3, 2448).astype(int)
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
+    fig = new_figure(10, 4)
+    ax1, ax2 = fig.subplots(1, 2)
 
     # In-degree (dependencies) - use integer-aligned bins
     max_in = max(in_degrees)
@@ -203,10 +224,7 @@ def fig4_degree_distribution():
     ax2.spines['top'].set_visible(False)
     ax2.spines['right'].set_visible(False)
 
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'degree_distribution.png', dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Saved {OUTPUT_DIR / 'degree_distribution.png'}")
+    save_figure(fig, 'degree_distribution.png')
 
 
 def fig5_network_sample():
@@ -242,7 +260,8 @@ def fig5_network_sample():
 
     G.add_edges_from(eitc_deps + other_deps)
 
-    fig, ax = plt.subplots(figsize=(8, 6))
+    fig = new_figure(8, 6)
+    ax = fig.add_subplot()
 
     # Position nodes in layers
     pos = {
@@ -284,10 +303,7 @@ def fig5_network_sample():
     ax.legend(handles=legend_elements, loc='upper right', fontsize=8)
 
     ax.axis('off')
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'network_sample.png', dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Saved {OUTPUT_DIR / 'network_sample.png'}")
+    save_figure(fig, 'network_sample.png')
 
 
 def fig6_ordering_comparison():
@@ -299,29 +315,19 @@ def fig6_ordering_comparison():
         return
 
     def calculate_forward_refs(order):
-        """Count forward references for an ordering."""
-        encoded = set()
-        forward_refs = []
-        cumulative = 0
-
-        for node in order:
-            deps = set(g._graph.successors(node))
-            unmet = len(deps - encoded)
-            cumulative += unmet
-            forward_refs.append(cumulative)
-            encoded.add(node)
-
-        return forward_refs
+        """Cumulative forward references for an ordering."""
+        return np.cumsum(g.forward_references(order))
 
     # Get orderings
     optimal = g.topological_sort(allow_cycles=True)
     nodes = list(g._graph.nodes())
 
     # Numerical order
+    digits = re.compile(r'\d+')
+
     def section_num(path):
-        sec = path.split('/')[-1]
-        num = ''.join(c for c in sec if c.isdigit())
-        return int(num) if num else float('inf')
+        match = digits.search(path.rsplit('/', 1)[-1])
+        return int(match.group()) if match else float('inf')
     numerical = sorted(nodes, key=section_num)
 
     # Random
@@ -334,7 +340,8 @@ def fig6_ordering_comparison():
     num_refs = calculate_forward_refs(numerical)
     rand_refs = calculate_forward_refs(random_order)
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(11, 4))
+    fig = new_figure(11, 4)
+    ax1, ax2 = fig.subplots(1, 2)
 
     # Left: Cumulative forward references
     x = np.arange(len(optimal))
@@ -350,8 +357,9 @@ def fig6_ordering_comparison():
 
     # Right: Bar chart of totals
     orderings = ['Optimal', 'Numerical', 'Random', 'Reverse\nOptimal']
+    # Only the total is plotted for reverse optimal, so skip the cumulative curve
     totals = [opt_refs[-1], num_refs[-1], rand_refs[-1],
-              calculate_forward_refs(list(reversed(optimal)))[-1]]
+              g.forward_references(optimal[::-1]).sum()]
     colors = [COLORS['secondary'], COLORS['primary'], COLORS['gray'], COLORS['accent']]
 
     bars = ax2.bar(orderings, totals, color=colors, edgecolor='white')
@@ -372,10 +380,7 @@ def fig6_ordering_comparison():
                 fontsize=9, color=COLORS['secondary'],
                 arrowprops=dict(arrowstyle='->', color=COLORS['secondary'], lw=1.5))
 
-    plt.tight_layout()
-    plt.savefig(OUTPUT_DIR / 'ordering_comparison.png', dpi=150, bbox_inches='tight')
-    plt.close()
-    print(f"Saved {OUTPUT_DIR / 'ordering_comparison.png'}")
+    save_figure(fig, 'ordering_comparison.png')
 
 
 if __name__ == '__main__':
@@ -0,0 +1,177 @@
+"""Graph kernels over compressed sparse row (CSR) adjacency.
+
+Each function takes a graph as plain Python lists of ints: indptr (row
+pointers) and indices (column indices), with node i's neighbors in
+indices[indptr[i]:indptr[i + 1]]. Keeping the kernels free of networkx
+and of StatuteGraph makes them independent of how the graph is stored.
+"""
+
+from __future__ import annotations
+
+
+def kahn_order(
+    indptr: list[int], rev_indptr: list[int], rev_indices: list[int]
+) -> list[int]:
+    """Kahn's algorithm, dependencies first.
+
+    Starts from nodes with no dependencies (empty forward rows) and
+    releases each dependent, found through the reverse CSR, once all of
+    its dependencies are emitted. Nodes on or behind a cycle are never
+    released, so a result shorter than the node count means the graph is
+    cyclic.
+    """
+    unmet = [indptr[i + 1] - indptr[i] for i in range(len(indptr) - 1)]
+
+    order = [i for i, count in enumerate(unmet) if count == 0]
+    for node in order:  # order grows while we iterate: a FIFO queue
+        for dependent in rev_indices[rev_indptr[node] : rev_indptr[node + 1]]:
+            unmet[dependent] -= 1
+            if unmet[dependent] == 0:
+                order.append(dependent)
+    return order
+
+
+def tarjan_scc(
+    indptr: list[int], indices: list[int]
+) -> tuple[list[list[int]], list[int]]:
+    """Tarjan's strongly connected components over CSR adjacency.
+
+    Uses an explicit stack of (node, next edge offset) frames instead of
+    recursion. Components are emitted once everything reachable from them
+    has been emitted, i.e. in reverse topological order of the condensation,
+    which under our edge semantics means dependencies first.
+
+    Returns:
+        (sccs, scc_of): SCCs as lists of node indices, and the SCC id of
+        every node.
+    """
+    num_nodes = len(indptr) - 1
+    index = [-1] * num_nodes
+    lowlink = [0] * num_nodes
+    on_stack = [False] * num_nodes
+    scc_of = [-1] * num_nodes
+    stack: list[int] = []
+    sccs: list[list[int]] = []
+    counter = 0
+
+    for root in range(num_nodes):
+        if index[root] != -1:
+            continue
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, indptr[root])]
+
+        while work:
+            v, pos = work[-1]
+            if pos < indptr[v + 1]:
+                work[-1] = (v, pos + 1)
+                w = indices[pos]
+                if index[w] == -1:
+                    index[w] = lowlink[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    on_stack[w] = True
+                    work.append((w, indptr[w]))
+                elif on_stack[w] and index[w] < lowlink[v]:
+                    lowlink[v] = index[w]
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if lowlink[v] < lowlink[parent]:
+                    lowlink[parent] = lowlink[v]
+            if lowlink[v] == index[v]:
+                scc_id = len(sccs)
+                scc = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    scc_of[w] = scc_id
+                    scc.append(w)
+                    if w == v:
+                        break
+                sccs.append(scc)
+
+    return sccs, scc_of
+
+
+def tarjan_scc_from(
+    indptr: list[int], indices: list[int], root: int, depths: list[int]
+) -> list[list[int]]:
+    """SCCs reachable from root whose depths are still unknown.
+
+    Same traversal as tarjan_scc, but nodes with depths[v] != -1 are
+    treated as finished, and per-node state lives in dicts, so the cost
+    is proportional to the part of the graph actually visited.
+
+    Returns:
+        SCCs as lists of node indices, dependencies first.
+    """
+    if depths[root] != -1:
+        return []
+    index = {root: 0}
+    lowlink = {root: 0}
+    on_stack = {root}
+    stack = [root]
+    sccs: list[list[int]] = []
+    work = [(root, indptr[root])]
+
+    while work:
+        v, pos = work[-1]
+        if pos < indptr[v + 1]:
+            work[-1] = (v, pos + 1)
+            w = indices[pos]
+            if w not in index:
+                if depths[w] != -1:
+                    continue
+                index[w] = lowlink[w] = len(index)
+                stack.append(w)
+                on_stack.add(w)
+                work.append((w, indptr[w]))
+            elif w in on_stack and index[w] < lowlink[v]:
+                lowlink[v] = index[w]
+            continue
+
+        work.pop()
+        if work:
+            parent = work[-1][0]
+            if lowlink[v] < lowlink[parent]:
+                lowlink[parent] = lowlink[v]
+        if lowlink[v] == index[v]:
+            scc = []
+            while True:
+                w = stack.pop()
+                on_stack.discard(w)
+                scc.append(w)
+                if w == v:
+                    break
+            sccs.append(scc)
+
+    return sccs
+
+
+def scc_depths(
+    indptr: list[int],
+    indices: list[int],
+    sccs: list[list[int]],
+    depths: list[int],
+) -> None:
+    """Fill in longest-path-to-root depths for the given SCCs, in place.
+
+    sccs must be in dependency-first order (as returned by tarjan_scc).
+    Every member of an SCC gets the same depth: 0 if it has no
+    dependencies outside the SCC, else one more than the deepest of them.
+    Dependencies outside these SCCs must already have a depth in depths.
+    """
+    for scc in sccs:
+        members = scc if len(scc) == 1 else set(scc)
+        depth = 0
+        for u in scc:
+            for v in indices[indptr[u] : indptr[u + 1]]:
+                if v not in members and depths[v] + 1 > depth:
+                    depth = depths[v] + 1
+        for u in scc:
+            depths[u] = depth
@@ -0,0 +1,128 @@
+"""Numba-compiled versions of the whole-graph kernels in _graph_core.
+
+Used when numba is installed (the 'speedups' extra), unless the
+STATUTE_GRAPH_DISABLE_NUMBA environment variable is set. The compiled
+functions take the int32 CSR arrays directly; the wrappers return the
+same Python types as their _graph_core counterparts.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+
+@njit(cache=True)
+def _kahn_order(indptr, rev_indptr, rev_indices):
+    num_nodes = indptr.shape[0] - 1
+    unmet = np.empty(num_nodes, np.int32)
+    order = np.empty(num_nodes, np.int32)
+    count = 0
+    for i in range(num_nodes):
+        unmet[i] = indptr[i + 1] - indptr[i]
+        if unmet[i] == 0:
+            order[count] = i
+            count += 1
+
+    head = 0
+    while head < count:
+        node = order[head]
+        head += 1
+        for j in range(rev_indptr[node], rev_indptr[node + 1]):
+            dependent = rev_indices[j]
+            unmet[dependent] -= 1
+            if unmet[dependent] == 0:
+                order[count] = dependent
+                count += 1
+    return order[:count]
+
+
+@njit(cache=True)
+def _tarjan_scc(indptr, indices):
+    num_nodes = indptr.shape[0] - 1
+    index = np.full(num_nodes, -1, np.int32)
+    lowlink = np.zeros(num_nodes, np.int32)
+    on_stack = np.zeros(num_nodes, np.bool_)
+    scc_of = np.full(num_nodes, -1, np.int32)
+    stack = np.empty(num_nodes, np.int32)
+    work_node = np.empty(num_nodes, np.int32)
+    work_pos = np.empty(num_nodes, np.int32)
+    # SCC members back to back, with SCC k at members[scc_start[k]:scc_start[k + 1]]
+    members = np.empty(num_nodes, np.int32)
+    scc_start = np.empty(num_nodes + 1, np.int32)
+    num_sccs = 0
+    num_members = 0
+    stack_size = 0
+    counter = 0
+
+    for root in range(num_nodes):
+        if index[root] != -1:
+            continue
+        index[root] = counter
+        lowlink[root] = counter
+        counter += 1
+        stack[stack_size] = root
+        stack_size += 1
+        on_stack[root] = True
+        work_node[0] = root
+        work_pos[0] = indptr[root]
+        work_size = 1
+
+        while work_size > 0:
+            v = work_node[work_size - 1]
+            pos = work_pos[work_size - 1]
+            if pos < indptr[v + 1]:
+                work_pos[work_size - 1] = pos + 1
+                w = indices[pos]
+                if index[w] == -1:
+                    index[w] = counter
+                    lowlink[w] = counter
+                    counter += 1
+                    stack[stack_size] = w
+                    stack_size += 1
+                    on_stack[w] = True
+                    work_node[work_size] = w
+                    work_pos[work_size] = indptr[w]
+                    work_size += 1
+                elif on_stack[w] and index[w] < lowlink[v]:
+                    lowlink[v] = index[w]
+                continue
+
+            work_size -= 1
+            if work_size > 0:
+                parent = work_node[work_size - 1]
+                if lowlink[v] < lowlink[parent]:
+                    lowlink[parent] = lowlink[v]
+            if lowlink[v] == index[v]:
+                scc_start[num_sccs] = num_members
+                while True:
+                    stack_size -= 1
+                    w = stack[stack_size]
+                    on_stack[w] = False
+                    scc_of[w] = num_sccs
+                    members[num_members] = w
+                    num_members += 1
+                    if w == v:
+                        break
+                num_sccs += 1
+
+    scc_start[num_sccs] = num_members
+    return members, scc_start[: num_sccs + 1], scc_of
+
+
+def kahn_order(
+    indptr: np.ndarray, rev_indptr: np.ndarray, rev_indices: np.ndarray
+) -> list[int]:
+    """Compiled _graph_core.kahn_order over CSR arrays."""
+    return _kahn_order(indptr, rev_indptr, rev_indices).tolist()
+
+
+def tarjan_scc(
+    indptr: np.ndarray, indices: np.ndarray
+) -> tuple[list[list[int]], list[int]]:
+    """Compiled _graph_core.tarjan_scc over CSR arrays."""
+    members, scc_start, scc_of = _tarjan_scc(indptr, indices)
+    members = members.tolist()
+    bounds = scc_start.tolist()
+    sccs = [members[bounds[k] : bounds[k + 1]] for k in range(len(bounds) - 1)]
+    return sccs, scc_of.tolist()
@@ -1,13 +1,25 @@
 """CLI for statute-graph analysis."""
 
+import csv
 import json
 import random
+import re
+import sys
 from pathlib import Path
+from typing import TextIO
 
 import click
 
 from . import from_xml
 
+_DIGITS = re.compile(r"\d+")
+
+
+def _section_num(path: str) -> int | float:
+    """Sort key for numerical order: first digit run of the last path segment."""
+    match = _DIGITS.search(path.rsplit("/", 1)[-1])
+    return int(match.group()) if match else float("inf")
+
 
 @click.group()
 @click.version_option()
@@ -65,24 +77,24 @@ def sequence(xml_path: Path, output: Path | None, fmt: str, prefix: str | None,
     for item in seq:
         item["section"] = item["citation_path"].split("/")[-1]
 
-    if fmt == "json":
-        content = json.dumps(seq, indent=2)
-    else:  # csv
-        import csv
-        from io import StringIO
-
-        buffer = StringIO()
-        writer = csv.DictWriter(buffer, fieldnames=["order", "section", "citation_path", "dependencies", "dependents", "scc_size"])
-        writer.writeheader()
-        writer.writerows(seq)
-        content = buffer.getvalue()
-
     if output:
         output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(content)
+        with output.open("w", newline="") as f:
+            _write_sequence(seq, fmt, f)
         click.echo(f"Wrote {len(seq)} sections to {output}", err=True)
     else:
-        click.echo(content)
+        _write_sequence(seq, fmt, sys.stdout)
+
+
+def _write_sequence(seq: list[dict], fmt: str, stream: TextIO) -> None:
+    """Stream an encoding sequence to a text stream as JSON or CSV."""
+    if fmt == "json":
+        json.dump(seq, stream, indent=2)
+        stream.write("\n")
+    else:  # csv
+        writer = csv.DictWriter(stream, fieldnames=["order", "section", "citation_path", "dependencies", "dependents", "scc_size"])
+        writer.writeheader()
+        writer.writerows(seq)
 
 
 @cli.command()
@@ -124,28 +136,15 @@ def compare(xml_path: Path, output: Path | None):
 
     def calculate_forward_refs(order):
         """Count forward references for an ordering."""
-        encoded = set()
-        total = 0
-        clean = 0
-        for node in order:
-            deps = set(graph._graph.successors(node))
-            unmet = len(deps - encoded)
-            total += unmet
-            if unmet == 0:
-                clean += 1
-            encoded.add(node)
-        return {"total_forward_refs": total, "pct_clean": clean / len(order) * 100}
+        unmet = graph.forward_references(order)
+        clean = int((unmet == 0).sum())
+        return {"total_forward_refs": int(unmet.sum()), "pct_clean": clean / len(order) * 100}
 
     # Get orderings
     optimal = graph.topological_sort(allow_cycles=True)
     nodes = list(graph._graph.nodes())
 
-    def section_num(path):
-        sec = path.split("/")[-1]
-        num = "".join(c for c in sec if c.isdigit())
-        return int(num) if num else float("inf")
-
-    numerical = sorted(nodes, key=section_num)
+    numerical = sorted(nodes, key=_section_num)
 
     random.seed(42)
     random_order = nodes.copy()
@@ -208,34 +207,19 @@ def generate(xml_path: Path, output_dir: Path):
 
     # Generate ordering comparison
     def calculate_forward_refs(order):
-        encoded = set()
-        total = 0
-        clean = 0
-        max_blocked = 0
-        for node in order:
-            deps = set(graph._graph.successors(node))
-            unmet = len(deps - encoded)
-            total += unmet
-            max_blocked = max(max_blocked, unmet)
-            if unmet == 0:
-                clean += 1
-            encoded.add(node)
+        unmet = graph.forward_references(order)
+        total = int(unmet.sum())
         return {
             "total_forward_refs": total,
-            "max_blocked": max_blocked,
+            "max_blocked": int(unmet.max()),
             "avg_blocked": total / len(order),
-            "pct_zero_blocked": clean / len(order) * 100,
+            "pct_zero_blocked": int((unmet == 0).sum()) / len(order) * 100,
         }
 
     optimal = graph.topological_sort(allow_cycles=True)
     nodes = list(graph._graph.nodes())
 
-    def section_num(path):
-        sec = path.split("/")[-1]
-        num = "".join(c for c in sec if c.isdigit())
-        return int(num) if num else float("inf")
-
-    numerical = sorted(nodes, key=section_num)
+    numerical = sorted(nodes, key=_section_num)
     random.seed(42)
     random_order = nodes.copy()
     random.shuffle(random_order)
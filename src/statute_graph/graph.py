@@ -2,10 +2,46 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-from typing import Any
+import bisect
+import heapq
+import os
+import sys
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, Iterable, Mapping
 
 import networkx as nx
+import numpy as np
+
+from ._graph_core import kahn_order, scc_depths, tarjan_scc, tarjan_scc_from
+
+_jit = None
+if not os.environ.get("STATUTE_GRAPH_DISABLE_NUMBA"):
+    try:
+        from . import _numba_kernels as _jit
+    except ImportError:  # numba is optional (the 'speedups' extra)
+        pass
+
+
+@dataclass(slots=True)
+class _SequenceItem:
+    """One entry of a cached encoding sequence (see get_encoding_sequence)."""
+
+    citation_path: str
+    order: int
+    scc_size: int
+    dependencies: int
+    dependents: int
+
+    def as_dict(self) -> dict:
+        """Plain dict form returned to callers."""
+        return {
+            "citation_path": self.citation_path,
+            "order": self.order,
+            "scc_size": self.scc_size,
+            "dependencies": self.dependencies,
+            "dependents": self.dependents,
+        }
 
 
 class StatuteGraph:
@@ -23,6 +59,121 @@ class StatuteGraph:
         """Create an empty statute graph."""
         self._graph = nx.DiGraph()
         self._encoded: set[str] = set()
+        # Per-node depths aligned with the CSR snapshot; -1 = not yet computed
+        self._depths: list[int] | None = None
+        self._depths_complete = False
+        self._topo_cache: list[str] | None = None
+        self._topo_idx: list[int] = []
+        self._acyclic = False  # Valid whenever _topo_cache is set
+        # SCCs as node-index lists in dependency-first order, plus each
+        # node's SCC id; computed by Tarjan over the CSR snapshot
+        self._scc_members: list[list[int]] | None = None
+        self._scc_of: list[int] = []
+        self._scc_cache: list[set[str]] | None = None
+        self._sequence_cache: list[_SequenceItem] | None = None
+        self._filter_index: tuple[list[str], np.ndarray, np.ndarray] | None = None
+        # CSR adjacency snapshot built by freeze(); None until frozen
+        self._idx2id: list[str] = []
+        self._id2idx: dict[str, int] = {}
+        self._indptr: np.ndarray | None = None
+        self._indices: np.ndarray | None = None
+        self._rev_indptr: np.ndarray | None = None
+        self._csr_list_cache: dict[bool, tuple[list[int], list[int]]] = {}
+        self._rev_indices: np.ndarray | None = None
+        self._edge_sources: np.ndarray | None = None
+        # Unencoded-dependency counts, built lazily and then kept current by
+        # add_node, add_edge and mark_encoded
+        self._unmet: dict[str, int] | None = None
+        self._ready: set[str] = set()
+
+    def _invalidate(self) -> None:
+        """Drop cached analytics after the graph structure changes."""
+        self._depths = None
+        self._depths_complete = False
+        self._topo_cache = None
+        self._scc_members = None
+        self._scc_cache = None
+        self._sequence_cache = None
+        self._filter_index = None
+        self._indptr = None
+        self._indices = None
+        self._rev_indptr = None
+        self._csr_list_cache = {}
+        self._rev_indices = None
+        self._edge_sources = None
+
+    def freeze(self) -> None:
+        """Compile the adjacency into compressed sparse row (CSR) arrays.
+
+        Nodes are numbered in insertion order. Forward arrays list each
+        node's dependencies, reverse arrays its dependents:
+        dependencies of node i are indices[indptr[i]:indptr[i + 1]].
+
+        The snapshot is discarded by the next add_node/add_edge that adds
+        a node or edge; call freeze() again once loading is done.
+        """
+        self._csr_list_cache = {}
+        self._idx2id = list(self._graph.nodes())
+        self._id2idx = {node: i for i, node in enumerate(self._idx2id)}
+        self._indptr, self._indices = self._build_csr(self._graph.succ)
+        self._rev_indptr, self._rev_indices = self._build_csr(self._graph.pred)
+        # Source node of each forward edge, aligned with indices
+        self._edge_sources = np.repeat(
+            np.arange(len(self._idx2id), dtype=np.int32), np.diff(self._indptr)
+        )
+
+    def _build_csr(self, adjacency: Any) -> tuple[np.ndarray, np.ndarray]:
+        """Build (indptr, indices) int32 arrays from a networkx adjacency view."""
+        counts = np.fromiter(
+            (len(adjacency[node]) for node in self._idx2id),
+            dtype=np.int32,
+            count=len(self._idx2id),
+        )
+        indptr = np.zeros(len(self._idx2id) + 1, dtype=np.int32)
+        np.cumsum(counts, out=indptr[1:])
+        indices = np.fromiter(
+            (self._id2idx[nbr] for node in self._idx2id for nbr in adjacency[node]),
+            dtype=np.int32,
+            count=int(indptr[-1]),
+        )
+        return indptr, indices
+
+    def _csr_lists(self, reverse: bool = False) -> tuple[list[int], list[int]]:
+        """CSR (indptr, indices) as Python lists for pure-Python kernels.
+
+        Forward arrays by default, dependents' arrays with reverse=True.
+        Scalar indexing into lists is much cheaper than into NumPy arrays.
+        """
+        if self._indptr is None:
+            self.freeze()
+        if reverse not in self._csr_list_cache:
+            if reverse:
+                arrays = (self._rev_indptr.tolist(), self._rev_indices.tolist())
+            else:
+                arrays = (self._indptr.tolist(), self._indices.tolist())
+            self._csr_list_cache[reverse] = arrays
+        return self._csr_list_cache[reverse]
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether a current CSR snapshot is available (see freeze())."""
+        return self._indptr is not None
+
+    def to_csr_matrix(self) -> tuple[Any, list[str]]:
+        """Export the CSR snapshot as a scipy.sparse matrix.
+
+        Entry (i, j) is 1 when node i depends on node j. Returns the matrix
+        and the citation path of each row, for use with scipy.sparse.csgraph.
+        Requires scipy (the 'sparse' extra).
+        """
+        from scipy.sparse import csr_matrix
+
+        if self._indptr is None:
+            self.freeze()
+        n = len(self._idx2id)
+        data = np.ones(len(self._indices), dtype=np.int8)
+        matrix = csr_matrix((data, self._indices, self._indptr), shape=(n, n))
+        return matrix, list(self._idx2id)
 
     def __contains__(self, node: str) -> bool:
         """Check if a node exists in the graph."""
@@ -68,35 +219,25 @@ class StatuteGraph:
             # Filter to all §32 subsections
             g.subgraph(prefix="26/32")
         """
-        import re
-
-        def get_section_num(path: str) -> int | None:
-            """Extract top-level section number from path."""
-            # Match patterns like us/statute/26/32 or us/statute/26/32/a/1
-            match = re.match(r".*/(\d+[A-Z]?)(?:/|$)", path)
-            if match:
-                sec = match.group(1)
-                # Handle sections like "32", "401", "7701A"
-                num_part = "".join(c for c in sec if c.isdigit())
-                return int(num_part) if num_part else None
-            return None
-
-        matching_nodes = []
-
-        for node in self._graph.nodes():
-            # Check prefix match
-            if prefix:
-                normalized = prefix if prefix.startswith("us/") else f"us/statute/{prefix}"
-                if not node.startswith(normalized):
-                    continue
-
-            # Check section range
-            if sections:
-                sec_num = get_section_num(node)
-                if sec_num is None or not (sections[0] <= sec_num <= sections[1]):
-                    continue
-
-            matching_nodes.append(node)
+        sorted_nodes, node_order, section_nums = self._get_filter_index()
+        mask = np.ones(len(sorted_nodes), dtype=bool)
+
+        # Check prefix match: matches form a contiguous run of sorted paths
+        if prefix:
+            normalized = prefix if prefix.startswith("us/") else f"us/statute/{prefix}"
+            lo = bisect.bisect_left(sorted_nodes, normalized)
+            hi = lo
+            while hi < len(sorted_nodes) and sorted_nodes[hi].startswith(normalized):
+                hi += 1
+            mask[:lo] = False
+            mask[hi:] = False
+
+        # Check section range (-1 marks paths without a section number)
+        if sections:
+            mask &= (section_nums >= sections[0]) & (section_nums <= sections[1])
+            mask &= section_nums >= 0
+
+        matching_nodes = [self._idx2id[i] for i in np.sort(node_order[mask]).tolist()]
 
         new_graph = StatuteGraph()
         subgraph = self._graph.subgraph(matching_nodes)
@@ -109,6 +250,29 @@ class StatuteGraph:
 
         return new_graph
 
+    def _get_filter_index(self) -> tuple[list[str], np.ndarray, np.ndarray]:
+        """Sorted citation paths with their node indices and section numbers.
+
+        Built once per graph version so subgraph() can filter with bisect
+        and NumPy masks instead of re-parsing every path.
+        """
+        if self._filter_index is None:
+            if self._indptr is None:
+                self.freeze()
+            sorted_nodes = sorted(self._idx2id)
+            node_order = np.fromiter(
+                (self._id2idx[node] for node in sorted_nodes),
+                dtype=np.int32,
+                count=len(sorted_nodes),
+            )
+            section_nums = np.fromiter(
+                (_section_number(node) for node in sorted_nodes),
+                dtype=np.int64,
+                count=len(sorted_nodes),
+            )
+            self._filter_index = (sorted_nodes, node_order, section_nums)
+        return self._filter_index
+
     def add_node(self, citation_path: str, **attrs: Any) -> None:
         """Add a statute section node.
 
@@ -116,7 +280,21 @@ class StatuteGraph:
             citation_path: Unique identifier like 'us/statute/26/32'
             **attrs: Additional attributes (level, heading, etc.)
         """
+        citation_path = sys.intern(citation_path)
+        is_new = citation_path not in self._graph
+        if self._unmet is not None:
+            self._track_new_node(citation_path)
         self._graph.add_node(citation_path, **attrs)
+        # Attribute updates leave the cached analytics valid
+        if is_new:
+            self._invalidate()
+
+    def _track_new_node(self, node: str) -> None:
+        """Register a node in the ready index if it isn't there yet."""
+        if node not in self._unmet:
+            self._unmet[node] = 0
+            if node not in self._encoded:
+                self._ready.add(node)
 
     def add_edge(
         self, from_node: str, to_node: str, ref_type: str = "unknown", **attrs: Any
@@ -129,15 +307,67 @@ class StatuteGraph:
             ref_type: Type of reference (internal_section, external_title, etc.)
             **attrs: Additional attributes
         """
+        from_node = sys.intern(from_node)
+        to_node = sys.intern(to_node)
+        is_new = not self._graph.has_edge(from_node, to_node)
+        if self._unmet is not None:
+            self._track_new_node(from_node)
+            self._track_new_node(to_node)
+            if is_new and to_node not in self._encoded:
+                self._unmet[from_node] += 1
+                self._ready.discard(from_node)
         self._graph.add_edge(from_node, to_node, ref_type=ref_type, **attrs)
+        if is_new:
+            self._invalidate()
+
+    def add_nodes_bulk(self, nodes: Iterable[tuple[str, dict[str, Any]]]) -> None:
+        """Add many statute section nodes in one networkx call.
+
+        Args:
+            nodes: (citation_path, attrs) pairs, as passed to add_node
+        """
+        nodes = [(sys.intern(citation_path), attrs) for citation_path, attrs in nodes]
+        if self._unmet is not None:
+            for citation_path, _ in nodes:
+                self._track_new_node(citation_path)
+        num_nodes = len(self._graph)
+        self._graph.add_nodes_from(nodes)
+        if len(self._graph) != num_nodes:
+            self._invalidate()
+
+    def add_edges_bulk(self, edges: Iterable[tuple[str, str, dict[str, Any]]]) -> None:
+        """Add many cross-reference edges in one networkx call.
+
+        Args:
+            edges: (from_node, to_node, attrs) triples; ref_type defaults
+                to 'unknown' as in add_edge
+        """
+        self._graph.add_edges_from(
+            ((sys.intern(u), sys.intern(v), attrs) for u, v, attrs in edges),
+            ref_type="unknown",
+        )
+        # Rebuilt lazily in one pass, cheaper than per-edge updates here
+        self._unmet = None
+        self._invalidate()
 
     def get_dependencies(self, node: str) -> list[str]:
         """Get all nodes that this node depends on (references)."""
-        return list(self._graph.successors(node))
+        return list(self._neighbors(node, self._graph._succ))
 
     def get_dependents(self, node: str) -> list[str]:
         """Get all nodes that depend on (reference) this node."""
-        return list(self._graph.predecessors(node))
+        return list(self._neighbors(node, self._graph._pred))
+
+    @staticmethod
+    def _neighbors(node: str, adjacency: Mapping) -> Mapping:
+        """A node's raw networkx neighbor dict (read-only by convention).
+
+        Faster than slicing the CSR snapshot for single-node lookups.
+        """
+        try:
+            return adjacency[node]
+        except KeyError:
+            raise nx.NetworkXError(f"The node {node} is not in the digraph.") from None
 
     def in_degree(self, node: str) -> int:
         """Number of dependencies (outgoing edges in our semantics)."""
@@ -157,40 +387,104 @@ class StatuteGraph:
         Raises:
             ValueError: If the graph contains cycles and allow_cycles=False.
         """
-        try:
-            # Reverse because we want dependencies first
-            return list(reversed(list(nx.topological_sort(self._graph))))
-        except nx.NetworkXUnfeasible:
-            if not allow_cycles:
-                cycles = list(nx.simple_cycles(self._graph))
-                raise ValueError(f"Graph contains cycle(s): {cycles[:3]}...")
-            # Condense SCCs and sort
-            return self._topological_sort_with_cycles()
-
-    def _topological_sort_with_cycles(self) -> list[str]:
-        """Topological sort that handles cycles by condensing SCCs."""
-        # Get strongly connected components
-        sccs = list(nx.strongly_connected_components(self._graph))
-
-        # Build condensation graph (each SCC becomes a node)
-        condensation = nx.condensation(self._graph, scc=sccs)
-
-        # Topological sort the DAG of SCCs
-        scc_order = list(reversed(list(nx.topological_sort(condensation))))
+        if self._topo_cache is None:
+            order = self._kahn_order()
+            self._acyclic = len(order) == len(self._idx2id)
+            if not self._acyclic:
+                # Condense SCCs and sort
+                order = self._topological_sort_with_cycles()
+            self._topo_idx = order
+            self._topo_cache = [self._idx2id[i] for i in order]
+        if not allow_cycles and not self._acyclic:
+            self._raise_cycle_error()
+        return list(self._topo_cache)
+
+    def is_dag(self) -> bool:
+        """Whether the graph is free of cycles, including self-references.
+
+        Only runs Kahn's pass, skipping the SCC condensation that
+        topological_sort() needs to order a cyclic graph.
+        """
+        if self._topo_cache is None:
+            order = self._kahn_order()
+            if len(order) < len(self._idx2id):
+                return False
+            self._acyclic = True
+            self._topo_idx = order
+            self._topo_cache = [self._idx2id[i] for i in order]
+        return self._acyclic
+
+    def _kahn_order(self) -> list[int]:
+        """Kahn's algorithm over the CSR snapshot; stops short on cycles."""
+        if _jit is not None:
+            if self._indptr is None:
+                self.freeze()
+            return _jit.kahn_order(self._indptr, self._rev_indptr, self._rev_indices)
+        indptr, _ = self._csr_lists()
+        return kahn_order(indptr, *self._csr_lists(reverse=True))
+
+    def _raise_cycle_error(self) -> None:
+        """Raise ValueError naming the cyclic SCCs in the graph.
+
+        Enumerating simple cycles is exponential in the worst case; SCCs of
+        size > 1 (or self-referencing nodes) identify the same cyclic
+        regions in linear time.
+        """
+        idx2id = self._idx2id
+        succ = self._graph._succ
+        cyclic = []
+        for scc in self._get_scc_members():
+            first = idx2id[scc[0]]
+            if len(scc) > 1 or first in succ[first]:
+                cyclic.append({idx2id[i] for i in scc})
+                if len(cyclic) == 3:  # Enough to point at the problem
+                    break
+        raise ValueError(f"Graph contains cycle(s) in SCCs: {cyclic}...")
+
+    def _get_scc_members(self) -> list[list[int]]:
+        """SCCs as lists of node indices, dependencies first.
+
+        Runs Tarjan's algorithm once over the CSR snapshot (freezing the
+        graph if needed) and caches the result until the graph changes.
+        """
+        if self._scc_members is None:
+            if _jit is not None:
+                if self._indptr is None:
+                    self.freeze()
+                self._scc_members, self._scc_of = _jit.tarjan_scc(
+                    self._indptr, self._indices
+                )
+            else:
+                self._scc_members, self._scc_of = tarjan_scc(*self._csr_lists())
+        return self._scc_members
+
+    def _topological_sort_with_cycles(self) -> list[int]:
+        """Topological sort (as node indices) that handles cycles by condensing SCCs.
+
+        Tarjan already emits SCCs dependency-first, so the condensation DAG
+        never has to be built or sorted.
+        """
+        scc_members = self._get_scc_members()
+        dependents = np.diff(self._rev_indptr).tolist()
 
         # Flatten: for each SCC in order, add its nodes
         result = []
-        for scc_id in scc_order:
-            scc_nodes = list(sccs[scc_id])
+        for scc in scc_members:
+            if len(scc) == 1:
+                result.append(scc[0])
+                continue
             # Sort nodes within SCC by out-degree (encode hubs first)
-            scc_nodes.sort(key=lambda n: self.out_degree(n), reverse=True)
-            result.extend(scc_nodes)
+            result.extend(sorted(scc, key=dependents.__getitem__, reverse=True))
 
         return result
 
     def get_sccs(self) -> list[set[str]]:
         """Get strongly connected components (circular reference groups)."""
-        return [scc for scc in nx.strongly_connected_components(self._graph)]
+        if self._scc_cache is None:
+            scc_members = self._get_scc_members()
+            idx2id = self._idx2id
+            self._scc_cache = [{idx2id[i] for i in scc} for scc in scc_members]
+        return [set(scc) for scc in self._scc_cache]
 
     def get_encoding_sequence(self) -> list[dict]:
         """Get optimal encoding sequence with metadata.
@@ -201,52 +495,129 @@ class StatuteGraph:
         - scc_size: Size of its SCC (1 = no cycles)
         - dependencies: Number of dependencies
         - dependents: Number of dependents
-        """
-        order = self.topological_sort(allow_cycles=True)
-
-        # Build SCC lookup
-        scc_lookup = {}
-        for scc in self.get_sccs():
-            for node in scc:
-                scc_lookup[node] = len(scc)
-
-        result = []
-        for i, node in enumerate(order):
-            result.append({
-                "citation_path": node,
-                "order": i + 1,
-                "scc_size": scc_lookup.get(node, 1),
-                "dependencies": self.in_degree(node),
-                "dependents": self.out_degree(node),
-            })
 
-        return result
+        The sequence is computed once per graph version; callers get fresh
+        dicts they are free to modify.
+        """
+        if self._sequence_cache is None:
+            self._sequence_cache = self._build_encoding_sequence()
+        return [item.as_dict() for item in self._sequence_cache]
+
+    def _build_encoding_sequence(self) -> list[_SequenceItem]:
+        """Compute the encoding sequence returned by get_encoding_sequence()."""
+        self.topological_sort(allow_cycles=True)
+        order = np.asarray(self._topo_idx, dtype=np.int32)
+        idx2id = self._idx2id
+        # Per-node columns gathered into encoding order with one fancy index each
+        dependencies = np.diff(self._indptr)[order].tolist()
+        dependents = np.diff(self._rev_indptr)[order].tolist()
+
+        # Every SCC is a single node unless Kahn's pass found a cycle
+        if self._acyclic:
+            scc_sizes = [1] * len(order)
+        else:
+            scc_members = self._get_scc_members()
+            sizes = np.fromiter(map(len, scc_members), np.int32, len(scc_members))
+            scc_of = np.asarray(self._scc_of, dtype=np.int32)
+            scc_sizes = sizes[scc_of[order]].tolist()
+
+        return [
+            _SequenceItem(
+                citation_path=idx2id[node],
+                order=i,
+                scc_size=size,
+                dependencies=num_deps,
+                dependents=num_dependents,
+            )
+            for i, node, size, num_deps, num_dependents in zip(
+                range(1, len(order) + 1),
+                self._topo_idx,
+                scc_sizes,
+                dependencies,
+                dependents,
+            )
+        ]
+
+    def _ensure_ready_index(self) -> dict[str, int]:
+        """Build the unmet-dependency counters and ready set if stale."""
+        if self._unmet is None:
+            self._unmet = {}
+            self._ready = set()
+            encoded = self._encoded
+            for node, deps in self._graph.succ.items():
+                if encoded:
+                    unmet = len(deps) - len(encoded.intersection(deps))
+                else:
+                    unmet = len(deps)
+                self._unmet[node] = unmet
+                if unmet == 0 and node not in self._encoded:
+                    self._ready.add(node)
+        return self._unmet
 
     def get_ready_nodes(self) -> list[str]:
         """Get nodes that are ready to encode (all dependencies encoded)."""
-        ready = []
-        for node in self._graph.nodes():
-            if node in self._encoded:
-                continue
-            deps = self.get_dependencies(node)
-            if all(dep in self._encoded for dep in deps):
-                ready.append(node)
-        return sorted(ready)
+        self._ensure_ready_index()
+        return sorted(self._ready)
 
     def get_blocked_by(self, node: str) -> list[str]:
         """Get unencoded dependencies blocking this node."""
-        deps = self.get_dependencies(node)
-        return [dep for dep in deps if dep not in self._encoded]
+        encoded = self._encoded
+        deps = self._neighbors(node, self._graph._succ)
+        return [dep for dep in deps if dep not in encoded]
 
     def mark_encoded(self, node: str) -> None:
-        """Mark a node as encoded."""
+        """Mark a node as encoded.
+
+        Updates the ready set incrementally: only the node's dependents
+        are touched, so polling get_ready_nodes() stays cheap.
+        """
+        if node in self._encoded:
+            return
         self._encoded.add(node)
+        if self._unmet is None or node not in self._graph:
+            return
+
+        self._ready.discard(node)
+        for dependent in self._graph._pred[node]:
+            self._unmet[dependent] -= 1
+            if self._unmet[dependent] == 0 and dependent not in self._encoded:
+                self._ready.add(dependent)
+
+    def mark_encoded_bulk(self, nodes: Iterable[str]) -> None:
+        """Mark many nodes as encoded, as if by mark_encoded() on each.
+
+        Membership updates are done as set operations on the whole batch;
+        dependents' counters are then updated in one pass.
+        """
+        new = set(nodes)
+        new -= self._encoded
+        if not new:
+            return
+        encoded = self._encoded
+        encoded |= new
+        if self._unmet is None:
+            return
+
+        unmet = self._unmet
+        ready = self._ready
+        ready -= new
+        pred = self._graph._pred
+        for node in new:
+            for dependent in pred.get(node, ()):
+                unmet[dependent] -= 1
+                if unmet[dependent] == 0 and dependent not in encoded:
+                    ready.add(dependent)
 
     def get_progress(self) -> dict[str, int]:
-        """Get encoding progress statistics."""
+        """Get encoding progress statistics.
+
+        Reads sizes of the maintained encoded/ready sets, so polling this
+        after every mark_encoded() is O(1) once the index exists.
+        """
+        self._ensure_ready_index()
         total = self.num_nodes
         encoded = len(self._encoded)
-        ready = len(self.get_ready_nodes())
+        ready = len(self._ready)
         blocked = total - encoded - ready
         return {
             "total": total,
@@ -255,31 +626,86 @@ class StatuteGraph:
             "blocked": blocked,
         }
 
+    def forward_references(self, order: list[str]) -> np.ndarray:
+        """Count unmet dependencies for each node when encoding in this order.
+
+        A dependency is unmet if it comes at or after the dependent node in
+        the order (or is missing from it). Computed for all edges at once on
+        the CSR snapshot, freezing the graph if needed.
+
+        Args:
+            order: Sequence of citation paths to encode, in order.
+
+        Returns:
+            Array of unmet-dependency counts aligned with order.
+        """
+        if self._indptr is None:
+            self.freeze()
+        num_nodes = len(self._idx2id)
+        order_idx = np.fromiter(
+            (self._id2idx[node] for node in order), dtype=np.int64, count=len(order)
+        )
+
+        # Direct-addressed int32 arrays keep the per-edge gathers compact
+        position = np.full(num_nodes, len(order), dtype=np.int32)
+        position[order_idx] = np.arange(len(order), dtype=np.int32)
+
+        sources = self._edge_sources
+        forward = position[self._indices] >= position[sources]
+        unmet = np.bincount(sources[forward], minlength=num_nodes)
+        return unmet[order_idx]
+
     def get_hubs(self, top_k: int = 10) -> list[tuple[str, int]]:
         """Get nodes with the most dependents (highest out-degree).
 
         These are "hub" sections that many other sections reference.
         """
-        degrees = [(node, self.out_degree(node)) for node in self._graph.nodes()]
-        degrees.sort(key=lambda x: x[1], reverse=True)
-        return degrees[:top_k]
+        # Dependents are incoming edges in networkx terms; read the raw
+        # predecessor dicts rather than dispatching through in_degree()
+        degrees = ((node, len(preds)) for node, preds in self._graph._pred.items())
+        return heapq.nlargest(top_k, degrees, key=lambda x: x[1])
 
     def depth(self, node: str) -> int:
         """Compute the longest path from this node to a root (no dependencies).
 
         Roots have depth 0. A node depending only on roots has depth 1, etc.
+        Nodes in the same strongly connected component share a depth.
+        Only the part of the graph reachable from node is visited; results
+        are cached until the graph changes.
         """
-        deps = self.get_dependencies(node)
-        if not deps:
-            return 0
-        return 1 + max(self.depth(dep) for dep in deps)
+        depths = self._ensure_depths()
+        try:
+            idx = self._id2idx[node]
+        except KeyError:
+            raise nx.NetworkXError(f"The node {node} is not in the digraph.") from None
+        if depths[idx] == -1:
+            sccs = tarjan_scc_from(*self._csr_lists(), idx, depths)
+            self._fill_depths(sccs)
+        return depths[idx]
+
+    def _ensure_depths(self) -> list[int]:
+        """Depth table for the current snapshot, freezing the graph if needed."""
+        if self._indptr is None:
+            self.freeze()
+        if self._depths is None:
+            self._depths = [-1] * len(self._idx2id)
+        return self._depths
+
+    def _fill_depths(self, sccs: list[list[int]]) -> None:
+        """Set depths for the given SCCs, which must be in dependency-first order.
+
+        Dependencies outside these SCCs must already have a depth.
+        """
+        scc_depths(*self._csr_lists(), sccs, self._depths)
 
     @property
     def max_depth(self) -> int:
         """Maximum depth in the graph."""
-        if self.num_nodes == 0:
-            return 0
-        return max(self.depth(node) for node in self._graph.nodes())
+        depths = self._ensure_depths()
+        if not self._depths_complete:
+            self._fill_depths(self._get_scc_members())
+            self._depths_complete = True
+        return max(depths, default=0)
 
     @property
     def avg_in_degree(self) -> float:
@@ -292,7 +718,17 @@ class StatuteGraph:
     @property
     def num_scc(self) -> int:
         """Number of strongly connected components."""
-        return nx.number_strongly_connected_components(self._graph)
+        return len(self._get_scc_members())
+
+    def copy(self) -> "StatuteGraph":
+        """Create an independent copy of the graph and its encoding state.
+
+        Cached analytics are not copied; the new graph rebuilds them lazily.
+        """
+        g = StatuteGraph()
+        g._graph = self._graph.copy()
+        g._encoded = set(self._encoded)
+        return g
 
     def subgraph_from_nodes(self, nodes: list[str]) -> "StatuteGraph":
         """Create a subgraph containing only the specified nodes.
@@ -306,24 +742,46 @@ class StatuteGraph:
 
     def get_ancestors(self, node: str, max_depth: int | None = None) -> set[str]:
         """Get all nodes that this node transitively depends on."""
-        if max_depth == 0:
-            return set()
-        ancestors = set()
-        for dep in self.get_dependencies(node):
-            ancestors.add(dep)
-            if max_depth is None or max_depth > 1:
-                next_depth = None if max_depth is None else max_depth - 1
-                ancestors.update(self.get_ancestors(dep, next_depth))
-        return ancestors
+        return self._reachable(node, self._graph._succ, max_depth)
 
     def get_descendants(self, node: str, max_depth: int | None = None) -> set[str]:
         """Get all nodes that transitively depend on this node."""
-        if max_depth == 0:
-            return set()
-        descendants = set()
-        for dep in self.get_dependents(node):
-            descendants.add(dep)
-            if max_depth is None or max_depth > 1:
-                next_depth = None if max_depth is None else max_depth - 1
-                descendants.update(self.get_descendants(dep, next_depth))
-        return descendants
+        return self._reachable(node, self._graph._pred, max_depth)
+
+    @staticmethod
+    def _reachable(
+        node: str,
+        adjacency: Mapping[str, Mapping[str, Any]],
+        max_depth: int | None,
+    ) -> set[str]:
+        """Breadth-first search from node, following at most max_depth hops.
+
+        Walks networkx's raw adjacency dicts directly rather than going
+        through successors()/predecessors() per visited node.
+        """
+        if node not in adjacency:
+            raise nx.NetworkXError(f"The node {node} is not in the digraph.")
+        seen: set[str] = set()
+        frontier = deque([(node, 0)])
+        while frontier:
+            current, dist = frontier.popleft()
+            if max_depth is not None and dist >= max_depth:
+                continue
+            for nbr in adjacency[current]:
+                if nbr not in seen:
+                    seen.add(nbr)
+                    frontier.append((nbr, dist + 1))
+        return seen
+
+
+def _section_number(path: str) -> int:
+    """Top-level section number of a citation path, or -1 if it has none.
+
+    Uses the last path segment shaped like a section number (digits plus
+    an optional capital letter, as in '32' or '7701A').
+    """
+    for segment in reversed(path.split("/")[1:]):
+        number = segment[:-1] if "A" <= segment[-1:] <= "Z" else segment
+        if number.isdecimal():
+            return int(number)
+    return -1
@@ -2,20 +2,67 @@
 
 from __future__ import annotations
 
+import functools
 import re
+import sys
 import xml.etree.ElementTree as ET
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Iterator
 
 from .graph import StatuteGraph
 
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # lxml is optional (the 'xml' extra)
+    lxml_etree = None
 
+USLM_NS = "{http://xml.house.gov/schemas/uslm/1.0}"
+SECTION_TAG = f"{USLM_NS}section"
+HEADING_TAG = f"{USLM_NS}heading"
+REF_TAG = f"{USLM_NS}ref"
+
+INTERNAL_SECTION = "internal_section"
+EXTERNAL_TITLE = "external_title"
+
+
+_USC_HREF = re.compile(r"/us/usc/t(\d+)/s(\d+[A-Za-z]?)(?:/(.+))?")
+_USC_PREFIX = "/us/usc/t"
+
+
+def _title_from_filename(name: str) -> str | None:
+    """Extract the title number from a usc<title>.xml filename."""
+    if not (name.startswith("usc") and name.endswith(".xml")):
+        return None
+    title = name[3:-4]
+    return title if title.isdecimal() else None
+
+
+@functools.lru_cache(maxsize=200_000)
 def parse_usc_href(href: str) -> tuple[str, str, str] | None:
     """Parse /us/usc/t26/s151 into (jurisdiction, title, section).
 
     Returns None if not a valid USC reference.
     """
-    match = re.match(r"/us/usc/t(\d+)/s(\d+[A-Za-z]?)(?:/(.+))?", href)
+    if not href.startswith(_USC_PREFIX):
+        return None
+
+    # Fast path for the usual /us/usc/t<title>/s<section>[/<sub>] shape
+    sec_start = href.find("/s", len(_USC_PREFIX))
+    title = href[len(_USC_PREFIX) : sec_start]
+    if sec_start != -1 and title.isdecimal():
+        section, _, subsection = href[sec_start + 2 :].partition("/")
+        number = section[:-1] if section[-1:].isalpha() else section
+        if (
+            number.isdecimal()
+            and section[-1:].isascii()
+            and "\n" not in subsection
+        ):
+            if subsection:
+                return ("us", title, f"{section}/{subsection}")
+            return ("us", title, section)
+
+    match = _USC_HREF.match(href)
     if match:
         title = match.group(1)
         section = match.group(2)
@@ -46,15 +93,27 @@ class USCodeLoader:
 
         return self._parse_xml(xml_path, str(title))
 
-    def load_all(self) -> StatuteGraph:
-        """Load all available titles into a single graph."""
+    def load_all(self, workers: int | None = None) -> StatuteGraph:
+        """Load all available titles into a single graph.
+
+        Titles are parsed in worker processes (one per CPU by default;
+        workers=1 parses in this process) and merged in filename order, so
+        cross-title references resolve exactly as in a sequential load.
+        """
         g = StatuteGraph()
-        for xml_path in sorted(self.data_dir.glob("usc*.xml")):
-            # Extract title number from filename
-            match = re.match(r"usc(\d+)\.xml", xml_path.name)
-            if match:
-                title = match.group(1)
-                self._parse_into_graph(xml_path, title, g)
+        xml_paths = [
+            xml_path
+            for xml_path in sorted(self.data_dir.glob("usc*.xml"))
+            if _title_from_filename(xml_path.name) is not None
+        ]
+        if workers == 1 or len(xml_paths) < 2:
+            for xml_path in xml_paths:
+                _add_parsed_title(g, *_parse_title_worker(xml_path))
+            return g
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for nodes, refs in executor.map(_parse_title_worker, xml_paths):
+                _add_parsed_title(g, nodes, refs)
         return g
 
     def _parse_xml(self, xml_path: Path, title: str) -> StatuteGraph:
@@ -67,73 +126,131 @@ class USCodeLoader:
         self, xml_path: Path, title: str, graph: StatuteGraph
     ) -> None:
         """Parse XML and add nodes/edges to existing graph."""
-        tree = ET.parse(xml_path)
-        root = tree.getroot()
+        _add_parsed_title(graph, *_parse_title_worker(xml_path))
+
 
-        ns = {"uslm": "http://xml.house.gov/schemas/uslm/1.0"}
+_NodeRecord = tuple[str, str, str]
+_RefRecord = tuple[str, str, tuple[str, str, str], str]
 
-        # First pass: add all section nodes
-        for section in root.iter("{http://xml.house.gov/schemas/uslm/1.0}section"):
-            identifier = section.get("identifier", "")
-            if not identifier:
+
+def _parse_title_worker(xml_path: Path) -> tuple[list[_NodeRecord], list[_RefRecord]]:
+    """Collect one title's sections and references as plain tuples.
+
+    Streams <section> elements in a single pass. Edges are resolved later
+    by _add_parsed_title, once every section is known; returning only
+    picklable tuples lets load_all run this in worker processes.
+    """
+    nodes: list[_NodeRecord] = []
+    refs: list[_RefRecord] = []
+
+    for section in iter_sections(xml_path):
+        identifier = section.get("identifier", "")
+        if not identifier:
+            continue
+
+        parsed = parse_usc_href(identifier)
+        if not parsed:
+            continue
+
+        sec_title = sys.intern(parsed[1])
+        citation_path = build_citation_path(*parsed)
+
+        # Get heading
+        heading_elem = section.find(HEADING_TAG)
+        heading = heading_elem.text if heading_elem is not None else ""
+        nodes.append((citation_path, sec_title, heading))
+
+        # Find all <ref> elements in this section
+        for ref in section.iter(REF_TAG):
+            href = ref.get("href", "")
+            if not href:
                 continue
 
-            parsed = parse_usc_href(identifier)
-            if not parsed:
+            to_parsed = parse_usc_href(href)
+            if not to_parsed:
                 continue
 
-            jurisdiction, sec_title, sec_num = parsed
-            citation_path = build_citation_path(jurisdiction, sec_title, sec_num)
+            ref_text = "".join(ref.itertext()).strip()
+            refs.append((citation_path, sec_title, to_parsed, ref_text))
 
-            # Get heading
-            heading_elem = section.find("uslm:heading", ns)
-            heading = heading_elem.text if heading_elem is not None else ""
+    return nodes, refs
 
-            graph.add_node(citation_path, title=sec_title, heading=heading)
 
-        # Second pass: add edges from cross-references
-        for section in root.iter("{http://xml.house.gov/schemas/uslm/1.0}section"):
-            identifier = section.get("identifier", "")
-            if not identifier:
-                continue
+def _add_parsed_title(
+    graph: StatuteGraph, nodes: list[_NodeRecord], refs: list[_RefRecord]
+) -> None:
+    """Add a parsed title's sections, then its resolvable references."""
+    graph.add_nodes_bulk(
+        (citation_path, {"title": sec_title, "heading": heading})
+        for citation_path, sec_title, heading in nodes
+    )
 
-            from_parsed = parse_usc_href(identifier)
-            if not from_parsed:
-                continue
+    placeholders: dict[str, dict[str, str]] = {}
+    edges: list[tuple[str, str, dict[str, str]]] = []
+    for from_path, from_title, to_parsed, ref_text in refs:
+        to_path = build_citation_path(*to_parsed)
+
+        # Determine reference type
+        if to_parsed[1] == from_title:  # Same title
+            ref_type = INTERNAL_SECTION
+        else:
+            ref_type = EXTERNAL_TITLE
 
-            from_path = build_citation_path(*from_parsed)
+        # Only add edge if target node exists or is in same title
+        if to_path not in graph and to_path not in placeholders:
+            if to_parsed[1] != from_title:
+                continue
+            placeholders[to_path] = {"title": sys.intern(to_parsed[1])}
+        edges.append((from_path, to_path, {"ref_type": ref_type, "text": ref_text}))
 
-            # Find all <ref> elements in this section
-            for ref in section.iter("{http://xml.house.gov/schemas/uslm/1.0}ref"):
-                href = ref.get("href", "")
-                if not href:
-                    continue
+    graph.add_nodes_bulk(placeholders.items())
+    graph.add_edges_bulk(edges)
 
-                to_parsed = parse_usc_href(href)
-                if not to_parsed:
-                    continue
 
-                to_path = build_citation_path(*to_parsed)
-                ref_text = "".join(ref.itertext()).strip()
+def iter_sections(xml_path: Path) -> Iterator[ET.Element]:
+    """Stream USLM <section> elements, freeing each one after it is used.
 
-                # Determine reference type
-                if to_parsed[1] == from_parsed[1]:  # Same title
-                    ref_type = "internal_section"
-                else:
-                    ref_type = "external_title"
+    Sections can nest (e.g. quoted sections in notes), and an outer
+    section's refs include those of its nested sections. So each
+    top-level section is yielded with its nested sections, in document
+    order, once it has closed, and freed only after all of them are used.
 
-                # Only add edge if target node exists or is in same title
-                if to_path in graph or to_parsed[1] == from_parsed[1]:
-                    if to_path not in graph:
-                        graph.add_node(to_path, title=to_parsed[1])
-                    graph.add_edge(from_path, to_path, ref_type=ref_type, text=ref_text)
+    Uses lxml's C parser with tag filtering when installed, otherwise the
+    standard library's iterparse.
+    """
+    if lxml_etree is not None:
+        context = lxml_etree.iterparse(
+            str(xml_path), events=("start", "end"), tag=SECTION_TAG
+        )
+    else:
+        context = ET.iterparse(xml_path, events=("start", "end"))
+
+    open_sections = 0
+    pending: list[ET.Element] = []  # Current top-level section and its nested ones
+    for event, elem in context:
+        if elem.tag != SECTION_TAG:
+            continue
+        if event == "start":
+            open_sections += 1
+            pending.append(elem)
+            continue
+
+        open_sections -= 1
+        if open_sections:
+            continue
+        yield from pending
+        pending.clear()
+        elem.clear()
+        if lxml_etree is not None:
+            # Drop already-processed siblings so the tree stays small
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
 
 
 def from_xml(xml_path: Path | str) -> StatuteGraph:
     """Convenience function to load a single USC XML file."""
     xml_path = Path(xml_path)
-    match = re.match(r"usc(\d+)\.xml", xml_path.name)
-    title = match.group(1) if match else "0"
+    title = _title_from_filename(xml_path.name) or "0"
 
     loader = USCodeLoader(xml_path.parent)
     return loader._parse_xml(xml_path, title)
@@ -0,0 +1,65 @@
+"""Shared graph fixtures.
+
+Each graph is built once per test module. Tests must not mutate them
+directly; take g.copy() before adding edges or marking nodes encoded.
+"""
+
+import pytest
+from statute_graph import StatuteGraph
+
+
+def _build(nodes, edges):
+    g = StatuteGraph()
+    for node in nodes:
+        g.add_node(node)
+    for from_node, to_node in edges:
+        g.add_edge(from_node, to_node)  # from_node depends on to_node
+    return g
+
+
+@pytest.fixture(scope="module")
+def empty_graph():
+    """A graph with no nodes."""
+    return StatuteGraph()
+
+
+@pytest.fixture(scope="module")
+def linear_abc():
+    """A -> B -> C: A depends on B, which depends on C."""
+    return _build("ABC", [("A", "B"), ("B", "C")])
+
+
+@pytest.fixture(scope="module")
+def diamond_abcd():
+    """Diamond: A -> B, A -> C, B -> D, C -> D."""
+    return _build("ABCD", [("A", "B"), ("A", "C"), ("B", "D"), ("C", "D")])
+
+
+@pytest.fixture(scope="module")
+def hub_graph():
+    """Five nodes where A, B, C and E all depend on D."""
+    return _build("ABCDE", [("A", "D"), ("B", "D"), ("C", "D"), ("E", "D")])
+
+
+@pytest.fixture(scope="module")
+def subgraph_corpus():
+    """Title 26 sections; A/32 references A/24 (internal) and 1 (external)."""
+    return _build(
+        [
+            "us/statute/26/1",
+            "us/statute/26/2",
+            "us/statute/26/A/32",
+            "us/statute/26/A/24",
+            "us/statute/26/B/100",
+        ],
+        [
+            ("us/statute/26/A/32", "us/statute/26/A/24"),  # internal
+            ("us/statute/26/A/32", "us/statute/26/1"),  # external
+        ],
+    )
+
+
+@pytest.fixture(scope="module")
+def sub_26A(subgraph_corpus):
+    """The 26/A subgraph of subgraph_corpus."""
+    return subgraph_corpus.subgraph("26/A")
@@ -49,6 +49,17 @@ class TestSequenceCommand:
         assert "citation_path" in content
         assert "order" in content
 
+    def test_sequence_stdout(self, runner, sample_xml):
+        """Sequence command writes to stdout when no output file is given."""
+        result = runner.invoke(cli, ["sequence", str(sample_xml)])
+        assert result.exit_code == 0
+        data = json.loads(result.stdout)
+        assert len(data) == 3
+
+        result = runner.invoke(cli, ["sequence", str(sample_xml), "--format", "csv"])
+        assert result.exit_code == 0
+        assert result.stdout.splitlines()[0].startswith("order,section,citation_path")
+
     def test_sequence_section_filter(self, runner, tmp_path, sample_xml):
         """Sequence command filters by section range."""
         output = tmp_path / "sequence.json"
@@ -0,0 +1,159 @@
+"""Tests for USC XML loaders."""
+
+import xml.etree.ElementTree as ET
+
+import pytest
+from statute_graph import loaders
+from statute_graph.loaders import USCodeLoader, _title_from_filename, parse_usc_href
+
+
+class TestParseUscHref:
+    """Test parsing of USLM reference hrefs."""
+
+    @pytest.mark.parametrize(
+        "href,expected",
+        [
+            ("/us/usc/t26/s151", ("us", "26", "151")),
+            ("/us/usc/t26/s7701A", ("us", "26", "7701A")),
+            ("/us/usc/t26/s32/a/1", ("us", "26", "32/a/1")),
+            ("/us/usc/t42/s1395", ("us", "42", "1395")),
+            ("/us/usc/t26/s151/", ("us", "26", "151")),
+            ("/us/usc/t26/s151ab", ("us", "26", "151a")),
+        ],
+    )
+    def test_valid_hrefs(self, href, expected):
+        """USC hrefs parse into (jurisdiction, title, section)."""
+        assert parse_usc_href(href) == expected
+
+    @pytest.mark.parametrize(
+        "href",
+        ["/us/pl/115/97", "/us/usc/t26", "/us/usc/t26/sA", "/us/usc/tX/s1", ""],
+    )
+    def test_invalid_hrefs(self, href):
+        """Non-USC or malformed hrefs return None."""
+        assert parse_usc_href(href) is None
+
+
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        ("usc26.xml", "26"),
+        ("usc05.xml", "05"),
+        ("usc.xml", None),
+        ("usc26a.xml", None),
+        ("usc26.xml.bak", None),
+        ("title26.xml", None),
+    ],
+)
+def test_title_from_filename(name, expected):
+    """Title numbers come from usc<title>.xml filenames only."""
+    assert _title_from_filename(name) == expected
+
+
+def _write_title(path, title, refs):
+    """Write a minimal USLM file with one section per (section, hrefs) pair."""
+    sections = "".join(
+        f'<section identifier="/us/usc/t{title}/s{sec}"><heading>S{sec}</heading>'
+        + "".join(f'<ref href="{href}">ref</ref>' for href in hrefs)
+        + "</section>"
+        for sec, hrefs in refs
+    )
+    path.write_text(
+        '<?xml version="1.0"?><usc xmlns="http://xml.house.gov/schemas/uslm/1.0">'
+        f"<main>{sections}</main></usc>"
+    )
+
+
+class TestLoadAll:
+    """Test loading every title in a directory."""
+
+    @pytest.fixture
+    def data_dir(self, tmp_path):
+        _write_title(tmp_path / "usc26.xml", 26, [("1", []), ("2", ["/us/usc/t26/s9"])])
+        _write_title(
+            tmp_path / "usc42.xml", 42, [("5", ["/us/usc/t26/s1", "/us/usc/t7/s1"])]
+        )
+        (tmp_path / "usc-notes.xml").write_text("<usc/>")
+        return tmp_path
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_load_all(self, data_dir, workers):
+        """Titles merge in filename order whether parsed in-process or not."""
+        g = USCodeLoader(data_dir).load_all(workers=workers)
+
+        assert list(g._graph) == [
+            "us/statute/26/1",
+            "us/statute/26/2",
+            "us/statute/26/9",  # Same-title placeholder
+            "us/statute/42/5",
+        ]
+        assert g.get_dependencies("us/statute/42/5") == ["us/statute/26/1"]
+        assert g._graph.edges["us/statute/42/5", "us/statute/26/1"]["ref_type"] == (
+            "external_title"
+        )
+
+
+NESTED_XML = """<?xml version="1.0"?>
+<usc xmlns="http://xml.house.gov/schemas/uslm/1.0">
+  <main>
+    <section identifier="/us/usc/t26/s1">
+      <heading>Outer</heading>
+      <content><ref href="/us/usc/t26/s2">section 2</ref></content>
+      <section identifier="/us/usc/t26/s8"><heading>Inner</heading></section>
+      <notes>
+        <quotedContent>
+          <section identifier="/us/usc/t26/s9">
+            <heading>Quoted</heading>
+            <ref href="/us/usc/t26/s3">section 3</ref>
+          </section>
+        </quotedContent>
+      </notes>
+      <ref href="/us/usc/t26/s4">section 4</ref>
+    </section>
+    <section identifier="/us/usc/t26/s2"><heading>Two</heading></section>
+  </main>
+</usc>"""
+
+
+class TestIterSections:
+    """Test streaming of (possibly nested) <section> elements."""
+
+    @pytest.fixture
+    def nested_xml(self, tmp_path):
+        xml_path = tmp_path / "usc26.xml"
+        xml_path.write_text(NESTED_XML)
+        return xml_path
+
+    @pytest.fixture
+    def expected(self, nested_xml, monkeypatch):
+        """The graph built from a fully parsed ET tree."""
+        with monkeypatch.context() as m:
+            m.setattr(
+                loaders,
+                "iter_sections",
+                lambda path: ET.parse(path).getroot().iter(loaders.SECTION_TAG),
+            )
+            return loaders.from_xml(nested_xml)
+
+    @pytest.mark.parametrize("use_lxml", [True, False])
+    def test_nested_sections(self, nested_xml, expected, monkeypatch, use_lxml):
+        """Nested and quoted sections don't lose their outer section's data."""
+        if use_lxml:
+            pytest.importorskip("lxml")
+        else:
+            monkeypatch.setattr(loaders, "lxml_etree", None)
+
+        g = loaders.from_xml(nested_xml)
+
+        assert list(g._graph.nodes(data=True)) == list(
+            expected._graph.nodes(data=True)
+        )
+        assert list(g._graph.edges(data=True)) == list(
+            expected._graph.edges(data=True)
+        )
+        assert g._graph.nodes["us/statute/26/1"]["heading"] == "Outer"
+        assert g.get_dependencies("us/statute/26/1") == [
+            "us/statute/26/2",
+            "us/statute/26/3",
+            "us/statute/26/4",
+        ]